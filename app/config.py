@@ -9,12 +9,65 @@ Handles environment variables and settings for:
 # pylint: disable=too-many-instance-attributes, invalid-name
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 
+def _getenv_int(key: str, default: int) -> int:
+    """Read an integer environment variable, falling back to a default"""
+    value = os.getenv(key)
+    return _parse_int(value) if value is not None else default
+
+
+def _getenv_bool(key: str, default: bool) -> bool:
+    """Read a boolean environment variable ("true" is truthy), with a default"""
+    value = os.getenv(key)
+    return _parse_bool(value) if value is not None else default
+
+
+@lru_cache(maxsize=32)
+def _parse_int(value: str) -> int:
+    """Parse an integer setting, memoized on the raw string"""
+    return int(value)
+
+
+@lru_cache(maxsize=32)
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean setting, memoized on the raw string"""
+    return value.lower() == "true"
+
+
 class Config:  # pylint: disable=too-few-public-methods
     """Configuration class for eBay Label Printer"""
 
+    # Settings are fixed attributes, so skip the per-instance __dict__
+    __slots__ = (
+        "EBAY_CLIENT_ID",
+        "EBAY_CLIENT_SECRET",
+        "EBAY_DEV_ID",
+        "EBAY_AUTH_TOKEN",
+        "EBAY_SANDBOX_CLIENT_ID",
+        "EBAY_SANDBOX_CLIENT_SECRET",
+        "EBAY_SANDBOX_DEV_ID",
+        "EBAY_SANDBOX_AUTH_TOKEN",
+        "EBAY_ENVIRONMENT",
+        "EBAY_SITE_ID",
+        "EBAY_API_DOMAIN",
+        "EBAY_SKIP_INIT",
+        "CUPS_SERVER_URI",
+        "PRINTER_NAME",
+        "POLLING_INTERVAL",
+        "POLLING_MAX_INTERVAL",
+        "MAX_CONCURRENCY",
+        "DRY_RUN",
+        "LOG_LEVEL",
+        "current_client_id",
+        "current_client_secret",
+        "current_dev_id",
+        "current_auth_token",
+        "_has_required_credentials",
+    )
+
     def __init__(self) -> None:
         """Initialize configuration with environment variables"""
         # eBay API Configuration - ebaysdk format
@@ -36,68 +89,63 @@ class Config:  # pylint: disable=too-few-public-methods
         # Environment setting (sandbox or production)
         self.EBAY_ENVIRONMENT: str = os.getenv("EBAY_ENVIRONMENT", "sandbox").lower()
         self.EBAY_SITE_ID: str = os.getenv("EBAY_SITE_ID", "0")  # US site ID
+        self.EBAY_API_DOMAIN: str = (
+            "api.sandbox.ebay.com"
+            if self.EBAY_ENVIRONMENT == "sandbox"
+            else "api.ebay.com"
+        )
+        # Don't create SDK connections at all (e.g. offline development)
+        self.EBAY_SKIP_INIT: bool = _getenv_bool("EBAY_SKIP_INIT", False)
 
         # CUPS Printer Configuration
         self.CUPS_SERVER_URI: str = os.getenv("CUPS_SERVER_URI", "localhost")
         self.PRINTER_NAME: str = os.getenv("PRINTER_NAME", "Thermal-Printer")
 
         # Application Settings
-        self.POLLING_INTERVAL: int = int(
-            os.getenv("POLLING_INTERVAL", "300")
-        )  # 5 minutes default
-        self.DRY_RUN: bool = os.getenv("DRY_RUN", "false").lower() == "true"
+        # 5 minutes default
+        self.POLLING_INTERVAL: int = _getenv_int("POLLING_INTERVAL", 300)
+        # Upper bound for the backed-off interval, 30 minutes default
+        self.POLLING_MAX_INTERVAL: int = _getenv_int("POLLING_MAX_INTERVAL", 1800)
+        # Most orders worked on (and eBay calls in flight) at once
+        self.MAX_CONCURRENCY: int = max(1, _getenv_int("MAX_CONCURRENCY", 8))
+        self.DRY_RUN: bool = _getenv_bool("DRY_RUN", False)
         self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
+        # Credentials for the current environment, resolved once
+        sandbox = self.EBAY_ENVIRONMENT == "sandbox"
+        self.current_client_id: Optional[str] = (
+            self.EBAY_SANDBOX_CLIENT_ID if sandbox else self.EBAY_CLIENT_ID
+        )
+        self.current_client_secret: Optional[str] = (
+            self.EBAY_SANDBOX_CLIENT_SECRET if sandbox else self.EBAY_CLIENT_SECRET
+        )
+        self.current_dev_id: Optional[str] = (
+            self.EBAY_SANDBOX_DEV_ID if sandbox else self.EBAY_DEV_ID
+        )
+        self.current_auth_token: Optional[str] = (
+            self.EBAY_SANDBOX_AUTH_TOKEN if sandbox else self.EBAY_AUTH_TOKEN
+        )
+        self._has_required_credentials: bool = all(
+            field is not None
+            for field in (
+                self.current_client_id,
+                self.current_client_secret,
+                self.current_dev_id,
+                self.current_auth_token,
+            )
+        )
+
     def validate(self) -> bool:
         """Validate that required configuration is present"""
-        if self.EBAY_ENVIRONMENT == "sandbox":
-            required_fields = [
-                self.EBAY_SANDBOX_CLIENT_ID,
-                self.EBAY_SANDBOX_CLIENT_SECRET,
-                self.EBAY_SANDBOX_DEV_ID,
-                self.EBAY_SANDBOX_AUTH_TOKEN,
-            ]
-        else:
-            required_fields = [
-                self.EBAY_CLIENT_ID,
-                self.EBAY_CLIENT_SECRET,
-                self.EBAY_DEV_ID,
-                self.EBAY_AUTH_TOKEN,
-            ]
-        return all(field is not None for field in required_fields)
-
-    @property
-    def current_client_id(self) -> Optional[str]:
-        """Get the client ID for the current environment"""
-        return (
-            self.EBAY_SANDBOX_CLIENT_ID
-            if self.EBAY_ENVIRONMENT == "sandbox"
-            else self.EBAY_CLIENT_ID
-        )
+        return self._has_required_credentials
 
-    @property
-    def current_client_secret(self) -> Optional[str]:
-        """Get the client secret for the current environment"""
-        return (
-            self.EBAY_SANDBOX_CLIENT_SECRET
-            if self.EBAY_ENVIRONMENT == "sandbox"
-            else self.EBAY_CLIENT_SECRET
-        )
 
-    @property
-    def current_dev_id(self) -> Optional[str]:
-        """Get the dev ID for the current environment"""
-        return (
-            self.EBAY_SANDBOX_DEV_ID
-            if self.EBAY_ENVIRONMENT == "sandbox"
-            else self.EBAY_DEV_ID
-        )
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the shared application configuration
 
-    @property
-    def current_auth_token(self) -> Optional[str]:
-        """Get the auth token for the current environment"""
-        return (
-            self.EBAY_SANDBOX_AUTH_TOKEN
-            if self.EBAY_ENVIRONMENT == "sandbox"
-            else self.EBAY_AUTH_TOKEN
-        )
+    The environment is read once on first call; subsequent calls return the
+    same Config instance.
+    """
+    return Config()
@@ -2,17 +2,27 @@
 Shared eBay API client functionality
 """
 import logging
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
 
 from ebaysdk.exception import ConnectionError as EbayConnectionError
-from ebaysdk.trading import Connection as TradingAPI
-from ebaysdk.finding import Connection as FindingAPI
-from ebaysdk.shopping import Connection as ShoppingAPI
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
 
+def as_list(value: Any) -> List[Any]:
+    """
+    Normalize an ebaysdk repeated field to a list
+
+    ebaysdk returns a bare dict when a repeated element (orders, transactions)
+    only has one entry, and nothing at all when it has none.
+    """
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
 class EbayClientMixin:  # pylint: disable=too-few-public-methods
     """Mixin class for shared eBay API client functionality"""
 
@@ -21,20 +31,31 @@ class EbayClientMixin:  # pylint: disable=too-few-public-methods
         self.trading_api = None
         self.finding_api = None
         self.shopping_api = None
+        self._api_config: Optional[Mapping[str, Any]] = None
         self._init_ebay_apis()
 
     def _init_ebay_apis(self) -> None:
         """Initialize eBay SDK API clients"""
+        if self.config.EBAY_SKIP_INIT:
+            logger.info("Skipping eBay API initialization (EBAY_SKIP_INIT is set)")
+            return
+
         try:
             if not self.config.validate():
                 logger.error("eBay API configuration is incomplete")
                 return
 
+            # Import the SDK connections lazily so code paths that never talk
+            # to eBay (dry runs, unit tests) don't pay for loading them
+            # pylint: disable=import-outside-toplevel
+            from ebaysdk.finding import Connection as FindingAPI
+            from ebaysdk.shopping import Connection as ShoppingAPI
+
             # Get configuration based on environment
             config_dict = self._get_api_config()
 
             # Initialize Trading API (for orders and selling)
-            self.trading_api = TradingAPI(config_file=None, **config_dict)
+            self.trading_api = self._create_trading_api()
 
             # Initialize Finding API (for searching)
             self.finding_api = FindingAPI(config_file=None, **config_dict)
@@ -57,18 +78,33 @@ class EbayClientMixin:  # pylint: disable=too-few-public-methods
             self.finding_api = None
             self.shopping_api = None
 
-    def _get_api_config(self) -> Dict[str, Any]:
-        """Get API configuration dictionary for ebaysdk"""
-        if self.config.EBAY_ENVIRONMENT == "sandbox":
-            domain = "api.sandbox.ebay.com"
-        else:
-            domain = "api.ebay.com"
+    def _create_trading_api(self) -> Any:
+        """
+        Create a new Trading API connection
+
+        ebaysdk connections keep per-request state, so concurrent calls each
+        need their own connection.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ebaysdk.trading import Connection as TradingAPI
+
+        return TradingAPI(config_file=None, **self._get_api_config())
+
+    def _get_api_config(self) -> Mapping[str, Any]:
+        """
+        Get API configuration for ebaysdk
+
+        Built once per client and returned as a read-only view, since it is
+        shared by every SDK connection and the underlying config is fixed.
+        """
+        if self._api_config is not None:
+            return self._api_config
 
         config = {
             "appid": self.config.current_client_id,
             "devid": self.config.current_dev_id,
             "certid": self.config.current_client_secret,
-            "domain": domain,
+            "domain": self.config.EBAY_API_DOMAIN,
             "siteid": self.config.EBAY_SITE_ID,
         }
 
@@ -76,4 +112,5 @@ class EbayClientMixin:  # pylint: disable=too-few-public-methods
         if self.config.current_auth_token:
             config["token"] = self.config.current_auth_token
 
-        return config
+        self._api_config = MappingProxyType(config)
+        return self._api_config
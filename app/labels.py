@@ -7,7 +7,10 @@ Handles:
 - PDF download and storage
 """
 # pylint: disable=useless-return
+import io
 import logging
+import os
+import shutil
 from typing import Dict, Any, Optional
 from pathlib import Path
 
@@ -16,17 +19,57 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, landscape
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ebaysdk.exception import ConnectionError as EbayConnectionError
 
-from .ebay_client import EbayClientMixin
+from . import __version__
+from .config import Config
+from .ebay_client import EbayClientMixin, as_list
 
 logger = logging.getLogger(__name__)
 
+# Buffer size used when streaming label downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Page size of the sandbox test label
+TEST_LABEL_PAGESIZE = landscape(letter)
+
 
 class LabelManager(EbayClientMixin):
     """Manages shipping label purchasing and handling"""
 
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self._http = self._create_http_session(config.MAX_CONCURRENCY)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections used for label downloads"""
+        self._http.close()
+
+    @staticmethod
+    def _create_http_session(pool_size: int) -> requests.Session:
+        """
+        Create a pooled HTTP session so label downloads reuse connections
+
+        Args:
+            pool_size: Most connections kept open per host, one per order
+                worker so concurrent downloads never wait on the pool
+        """
+        session = requests.Session()
+        session.headers.update({"User-Agent": f"ebay-label-printer/{__version__}"})
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=pool_size, max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def buy_shipping_label(
         self, order_data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -37,7 +80,8 @@ class LabelManager(EbayClientMixin):
             order_data: eBay order information
 
         Returns:
-            Label information including PDF path, or None if failed
+            Label information including the PDF Path under "pdf_path",
+            or None if failed
         """
         order_id = order_data.get("OrderID", "unknown")
         logger.info("Buying shipping label for order %s", order_id)
@@ -53,15 +97,14 @@ class LabelManager(EbayClientMixin):
             # In production, this would use eBay's shipping label APIs
 
             # Extract transaction information from order
-            transactions = order_data.get("TransactionArray", {}).get("Transaction", [])
+            # Handles the single transaction case (not in array)
+            transactions = as_list(
+                order_data.get("TransactionArray", {}).get("Transaction")
+            )
             if not transactions:
                 logger.error("No transactions found in order %s", order_id)
                 return None
 
-            # Handle single transaction case
-            if isinstance(transactions, dict):
-                transactions = [transactions]
-
             transaction = transactions[0]
             transaction_id = transaction.get("TransactionID", "")
             item_id = transaction.get("Item", {}).get("ItemID", "")
@@ -86,7 +129,7 @@ class LabelManager(EbayClientMixin):
                 # Create a simple test PDF
                 pdf_path = self.create_test_label_pdf(order_id, mock_tracking_number)
                 if pdf_path:
-                    label_data["pdf_path"] = str(pdf_path)
+                    label_data["pdf_path"] = pdf_path
                     label_data["label_url"] = f"mock://test_label_{order_id}.pdf"
                     logger.info("Created test shipping label for order %s", order_id)
                     return label_data
@@ -126,13 +169,21 @@ class LabelManager(EbayClientMixin):
             pdf_filename = f"shipping_label_{order_id}.pdf"
             pdf_path = data_dir / pdf_filename
 
-            # Download the PDF
-            response = requests.get(label_url, timeout=30)
-            response.raise_for_status()
-
-            # Save to file
-            with open(pdf_path, "wb") as f:
-                f.write(response.content)
+            # Stream the PDF to a temporary file through a fixed-size buffer and
+            # only move it into place once complete, so an interrupted download
+            # never leaves a truncated label behind to be printed
+            tmp_path = pdf_path.with_name(pdf_path.name + ".tmp")
+            try:
+                with self._http.get(label_url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with open(tmp_path, "wb") as f:
+                        shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, pdf_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
 
             logger.info("Successfully downloaded label PDF to %s", pdf_path)
             return pdf_path
@@ -167,8 +218,9 @@ class LabelManager(EbayClientMixin):
         pdf_filename = f"test_shipping_label_{order_id}.pdf"
         pdf_path = data_dir / pdf_filename
 
-        # Create simple test PDF
-        c = canvas.Canvas(str(pdf_path), pagesize=landscape(letter))
+        # Render the test PDF in memory, then write it out in one go
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=TEST_LABEL_PAGESIZE)
 
         # Add test label content
         c.setFont("Helvetica-Bold", 16)
@@ -185,5 +237,13 @@ class LabelManager(EbayClientMixin):
 
         c.save()
 
+        # Write to a temporary file and rename so readers never see a partial PDF
+        tmp_path = pdf_path.with_name(pdf_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(buffer.getvalue())
+            os.replace(tmp_path, pdf_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
         logger.info("Created test PDF label at %s", pdf_path)
         return pdf_path
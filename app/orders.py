@@ -7,19 +7,162 @@ Handles:
 - Filtering orders based on API status
 """
 
+import itertools
 import logging
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
 
 from ebaysdk.exception import ConnectionError as EbayConnectionError
-from .ebay_client import EbayClientMixin
+from .config import Config
+from .ebay_client import EbayClientMixin, as_list
 
 logger = logging.getLogger(__name__)
 
+# Growth factor applied per consecutive error/idle poll
+BACKOFF_BASE = 1.3
+# Maximum +/- fraction of random jitter applied to each interval
+BACKOFF_JITTER = 0.2
+
+# How far back GetOrders looks for orders
+ORDER_LOOKBACK = timedelta(days=7)
+# Orders requested per GetOrders page
+ORDERS_PAGE_SIZE = 50
+# Most GetOrders pages fetched per poll
+MAX_ORDER_PAGES = 10
+# Concurrent GetOrders page requests, kept low for eBay's rate limits
+MAX_PAGE_WORKERS = 4
+# Minimum orders in the lookback window before adapting the base interval
+MIN_ORDERS_FOR_ESTIMATE = 3
+# Poll this many times per expected gap between orders
+POLLS_PER_ORDER_GAP = 10
+# Backoff steps kept available above the estimated base interval
+ESTIMATE_BACKOFF_HEADROOM = 2
+
+
+def _ebay_timestamp(dt: datetime) -> str:
+    """Format a UTC datetime the way the Trading API expects"""
+    return f"{dt:%Y-%m-%dT%H:%M:%S}.000Z"
+
 
 class OrderManager(EbayClientMixin):
     """Manages eBay order polling and status-based filtering"""
 
+    # Static part of the GetOrders request; timestamps are added per poll
+    _GET_ORDERS_REQUEST: ClassVar[Dict[str, Any]] = {
+        "OrderStatus": "Completed",  # Get completed orders
+        "ListingType": "FixedPriceItem",  # Focus on Buy It Now items
+        "Pagination": {"EntriesPerPage": ORDERS_PAGE_SIZE, "PageNumber": 1},
+    }
+
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self._err_streak = 0
+        self._idle_streak = 0
+        # Orders handled by this process that eBay may not report as shipped
+        # yet, mapped to when they were marked (time.monotonic), oldest first
+        self._seen_orders: Dict[str, float] = {}
+        # Base poll interval estimated from recent order volume, if known
+        self._estimated_interval: Optional[float] = None
+
+    def is_order_seen(self, order_id: str) -> bool:
+        """Check whether an order was already processed by this process"""
+        return order_id in self._seen_orders
+
+    def mark_order_processed(self, order_id: str) -> None:
+        """
+        Remember that an order has been processed
+
+        eBay can take a while to set ShippedTime after a label is bought, so
+        this keeps the next polls from printing the same order twice.
+
+        Orders that have aged out of the GetOrders lookback window can never
+        be returned again, so they are forgotten to keep memory bounded.
+
+        Args:
+            order_id: eBay order identifier
+        """
+        now = time.monotonic()
+        # Re-insert so the dict stays ordered by mark time
+        self._seen_orders.pop(order_id, None)
+        self._seen_orders[order_id] = now
+
+        cutoff = now - ORDER_LOOKBACK.total_seconds()
+        expired = list(
+            itertools.takewhile(
+                lambda seen_id: self._seen_orders[seen_id] < cutoff, self._seen_orders
+            )
+        )
+        for seen_id in expired:
+            del self._seen_orders[seen_id]
+
+    def compute_next_interval(self) -> float:
+        """
+        Compute how long to wait before the next poll
+
+        The base interval is POLLING_INTERVAL, or longer for low-volume
+        sellers (see _update_interval_estimate). It is grown exponentially
+        for each consecutive failed or empty poll and randomly jittered so
+        retries don't synchronize. The jittered delay never exceeds
+        POLLING_MAX_INTERVAL.
+
+        Returns:
+            Delay in seconds
+        """
+        base = self._estimated_interval or self.config.POLLING_INTERVAL
+        max_interval = self.config.POLLING_MAX_INTERVAL
+        # Stop growing once the cap is reached, so a long streak can't overflow
+        max_steps = (
+            math.ceil(math.log(max_interval / base, BACKOFF_BASE))
+            if 0 < base < max_interval
+            else 0
+        )
+        streak = min(self._err_streak + self._idle_streak, max_steps)
+        delay = base * BACKOFF_BASE**streak
+        jitter = random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER)
+        return min(max_interval, delay * (1 + jitter))
+
+    def _update_interval_estimate(self, orders: List[Dict[str, Any]]) -> None:
+        """
+        Estimate a base poll interval from the recent order arrival rate
+
+        Treating orders as a Poisson process, the mean gap between orders is
+        the lookback window divided by the number of orders seen in it. We
+        poll POLLS_PER_ORDER_GAP times per expected gap, but never more often
+        than POLLING_INTERVAL, and never so rarely that fewer than
+        ESTIMATE_BACKOFF_HEADROOM backoff steps remain below
+        POLLING_MAX_INTERVAL. With too little history, or every page we are
+        willing to fetch full (so the real count is unknown), POLLING_INTERVAL
+        is used.
+
+        Args:
+            orders: All orders returned for the lookback window
+        """
+        max_orders = ORDERS_PAGE_SIZE * MAX_ORDER_PAGES
+        estimate: Optional[float] = None
+        if MIN_ORDERS_FOR_ESTIMATE <= len(orders) < max_orders:
+            mean_gap = ORDER_LOOKBACK.total_seconds() / len(orders)
+            ceiling = (
+                self.config.POLLING_MAX_INTERVAL
+                / BACKOFF_BASE**ESTIMATE_BACKOFF_HEADROOM
+            )
+            estimate = max(
+                self.config.POLLING_INTERVAL,
+                min(ceiling, mean_gap / POLLS_PER_ORDER_GAP),
+            )
+
+        if estimate != self._estimated_interval:
+            logger.info(
+                "Base poll interval now %.0fs (%d orders in the last %d days)",
+                estimate or self.config.POLLING_INTERVAL,
+                len(orders),
+                ORDER_LOOKBACK.days,
+            )
+        self._estimated_interval = estimate
+
     @staticmethod
     def extract_orders_from_response(response) -> List[Dict[str, Any]]:
         """
@@ -31,17 +174,79 @@ class OrderManager(EbayClientMixin):
         Returns:
             List of order dictionaries
         """
-        orders = []
-        if response.reply.Ack in ["Success", "Warning"]:
-            orders_array = response.dict().get("OrderArray")
-            if orders_array and isinstance(orders_array, dict):
-                orders = orders_array.get("Order", [])
+        if response.reply.Ack not in ["Success", "Warning"]:
+            return []
 
-            # Handle single order case (not in array)
-            if isinstance(orders, dict):
-                orders = [orders]
+        orders_array = response.dict().get("OrderArray")
+        if not isinstance(orders_array, dict):
+            return []
+
+        # Handles the single order case (not in array)
+        return as_list(orders_array.get("Order"))
+
+    @staticmethod
+    def get_total_pages(response) -> int:
+        """
+        Get the number of GetOrders result pages from an eBay API response
+
+        Args:
+            response: eBay API response object
+
+        Returns:
+            Total number of pages, 1 if the response doesn't say
+        """
+        if response.reply.Ack not in ["Success", "Warning"]:
+            return 1
+
+        pagination = response.dict().get("PaginationResult")
+        if not isinstance(pagination, dict):
+            return 1
+
+        try:
+            return max(1, int(pagination.get("TotalNumberOfPages", 1)))
+        except (TypeError, ValueError):
+            return 1
+
+    def _fetch_orders_page(
+        self, api_request: Dict[str, Any], page_number: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch one GetOrders page on its own connection"""
+        page_request = {
+            **api_request,
+            "Pagination": {**api_request["Pagination"], "PageNumber": page_number},
+        }
+        response = self._create_trading_api().execute("GetOrders", page_request)
+        return self.extract_orders_from_response(response)
+
+    def _fetch_remaining_pages(
+        self, api_request: Dict[str, Any], total_pages: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch GetOrders pages 2..total_pages concurrently
+
+        Args:
+            api_request: The page 1 GetOrders request
+            total_pages: Total number of pages reported by page 1
+
+        Returns:
+            Orders from the remaining pages, in page order
+        """
+        if total_pages > MAX_ORDER_PAGES:
+            logger.warning(
+                "GetOrders returned %d pages, only fetching the first %d",
+                total_pages,
+                MAX_ORDER_PAGES,
+            )
+        page_numbers = range(2, min(total_pages, MAX_ORDER_PAGES) + 1)
 
-        return orders
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PAGE_WORKERS, len(page_numbers))
+        ) as executor:
+            pages = executor.map(
+                lambda page_number: self._fetch_orders_page(api_request, page_number),
+                page_numbers,
+            )
+            return [order for page in pages for order in page]
 
     def poll_new_orders(self) -> List[Dict[str, Any]]:
         """
@@ -59,37 +264,62 @@ class OrderManager(EbayClientMixin):
 
         try:
             # Get orders from the last 7 days to catch any recent orders
-            from_date = datetime.now() - timedelta(days=7)
-            to_date = datetime.now()
+            # eBay interprets these timestamps as UTC
+            to_date = datetime.now(timezone.utc)
+            from_date = to_date - ORDER_LOOKBACK
 
             # Use GetOrders call from Trading API - ebaysdk handles authentication
             api_request = {
-                "CreateTimeFrom": from_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "CreateTimeTo": to_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "OrderStatus": "Completed",  # Get completed orders
-                "ListingType": "FixedPriceItem",  # Focus on Buy It Now items
-                "Pagination": {"EntriesPerPage": 50, "PageNumber": 1},
+                **self._GET_ORDERS_REQUEST,
+                # Copied so the SDK can never mutate the shared template
+                "Pagination": dict(self._GET_ORDERS_REQUEST["Pagination"]),
+                "CreateTimeFrom": _ebay_timestamp(from_date),
+                "CreateTimeTo": _ebay_timestamp(to_date),
             }
 
             response = self.trading_api.execute("GetOrders", api_request)
 
             orders = self.extract_orders_from_response(response)
-            for order in orders:
-                order_id = order.get("OrderID", "")
+            total_pages = self.get_total_pages(response)
+            if total_pages > 1:
+                orders += self._fetch_remaining_pages(api_request, total_pages)
+                # Pages are fetched at different times, so an order can shift
+                # across a page boundary and be returned twice; keep the first
+                unique_orders: Dict[Any, Dict[str, Any]] = {}
+                for order in orders:
+                    unique_orders.setdefault(order.get("OrderID"), order)
+                orders = list(unique_orders.values())
+            self._update_interval_estimate(orders)
 
-                # Check if order needs fulfillment
-                order_status = order.get("OrderStatus", "")
-                shipped_time = order.get("ShippedTime")
+            # Only process orders that are completed but not yet shipped
+            # Once we buy and print a label, the order status should change to Shipped
+            seen_orders = self._seen_orders
+            orders_needing_fulfillment = [
+                order
+                for order in orders
+                if order.get("OrderStatus") == "Completed"
+                and not order.get("ShippedTime")
+                and order.get("OrderID") not in seen_orders
+            ]
+            if orders_needing_fulfillment:
+                logger.info(
+                    "Found orders needing fulfillment: %s",
+                    ", ".join(
+                        order.get("OrderID", "") for order in orders_needing_fulfillment
+                    ),
+                )
 
-                # Only process orders that are completed but not yet shipped
-                # Once we buy and print a label, the order status should change to Shipped
-                if order_status == "Completed" and not shipped_time:
-                    orders_needing_fulfillment.append(order)
-                    logger.info("Found order needing fulfillment: %s", order_id)
+            self._err_streak = 0
+            if orders_needing_fulfillment:
+                self._idle_streak = 0
+            else:
+                self._idle_streak += 1
 
         except EbayConnectionError as e:
+            self._err_streak += 1
             logger.error("eBay API connection error while polling orders: %s", e)
         except (OSError, ValueError, KeyError) as e:
+            self._err_streak += 1
             logger.error("Unexpected error while polling orders: %s", e)
 
         logger.info(
@@ -8,27 +8,73 @@ Handles:
 # pylint: disable=useless-return
 
 
+import functools
+import hashlib
+import html
+import io
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 from pathlib import Path
 
 
-import reportlab.platypus  # type: ignore
-import reportlab.lib.pagesizes  # type: ignore
-import reportlab.lib.styles  # type: ignore
-import reportlab.lib.colors  # type: ignore
-import reportlab.lib.units  # type: ignore
+import reportlab  # type: ignore
 
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
 
+def _load_reportlab() -> None:
+    """
+    Import the reportlab submodules used for packing slips
+
+    These pull in most of reportlab, so they are only loaded once a slip is
+    actually generated rather than whenever the app imports this module.
+    """
+    # pylint: disable=import-outside-toplevel, redefined-outer-name, unused-import
+    import reportlab.platypus
+    import reportlab.lib.styles
+    import reportlab.lib.colors
+
+
+# Per-process generator used by generate_packing_slips workers
+_worker_generator: Optional["PackingSlipGenerator"] = None
+
+
+def _init_worker(config: Config) -> None:
+    """Build the worker's generator (and its styles) once per process"""
+    global _worker_generator  # pylint: disable=global-statement
+    _worker_generator = PackingSlipGenerator(config)
+
+
+def _generate_in_worker(order_data: Dict[str, Any]) -> Optional[Path]:
+    """Generate a packing slip using the worker's generator"""
+    assert _worker_generator is not None
+    return _worker_generator.generate_packing_slip(order_data)
+
+
 class PackingSlipGenerator:
     """Generates packing slips for order fulfillment"""
 
+    # 4"x6" page size, in points (72 per inch)
+    PAGESIZE = (4 * 72.0, 6 * 72.0)
+    # Order fields needed to generate a packing slip
+    REQUIRED_FIELDS = frozenset({"order_id", "buyer_address"})
+    # Directory generated packing slips are written to
+    OUTPUT_DIR = Path("data/packing_slips")
+    # Most slips remembered for reuse, least recently used dropped first
+    MAX_REUSABLE_SLIPS = 500
+
     def __init__(self, config: Config):
         self.config = config
+        self.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        # Order ID -> (content hash, path) of the last slip generated for it,
+        # so retries and reprints of an unchanged order skip rendering.
+        # Least recently used first, and capped at MAX_REUSABLE_SLIPS entries
+        self._generated: Dict[str, Tuple[str, Path]] = {}
 
     def generate_packing_slip(self, order_data: Dict[str, Any]) -> Optional[Path]:
         """
@@ -49,23 +95,32 @@ class PackingSlipGenerator:
                 logger.error("Invalid order data for order %s", order_id)
                 return None
 
+            # Skip rendering if this exact slip was already generated
+            content_key = self._content_key(order_data)
+            cached_key, cached_path = self._generated.get(order_id, ("", None))
+            if cached_key == content_key and cached_path and cached_path.exists():
+                logger.info("Reusing packing slip PDF: %s", cached_path)
+                self._remember_slip(order_id, cached_key, cached_path)
+                return cached_path
+
             # Create PDF file path
-            output_dir = Path("data/packing_slips")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            pdf_path = output_dir / f"packing_slip_{order_id}.pdf"
-
-            # Create PDF document with 4"x6" page size
-            custom_pagesize = (
-                4 * reportlab.lib.units.inch,
-                6 * reportlab.lib.units.inch,
-            )
-            doc = reportlab.platypus.SimpleDocTemplate(
-                str(pdf_path), pagesize=custom_pagesize
-            )
+            pdf_path = self.OUTPUT_DIR / f"packing_slip_{order_id}.pdf"
+
+            _load_reportlab()
+            buffer = io.BytesIO()
+            doc = self._make_doc(buffer)
             story = self._build_pdf_content(order_data, order_id)
 
-            # Build PDF
+            # Build PDF in memory, then write it out in one go via a temporary
+            # file so a partially written slip is never picked up for printing
             doc.build(story)
+            tmp_path = pdf_path.with_name(pdf_path.name + ".tmp")
+            try:
+                tmp_path.write_bytes(buffer.getbuffer())
+                os.replace(tmp_path, pdf_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            self._remember_slip(order_id, content_key, pdf_path)
 
             logger.info("Successfully generated packing slip PDF: %s", pdf_path)
             return pdf_path
@@ -83,6 +138,63 @@ class PackingSlipGenerator:
             )
             return None
 
+    def generate_packing_slips(
+        self, orders: List[Dict[str, Any]]
+    ) -> List[Optional[Path]]:
+        """
+        Generate packing slips for several orders in parallel
+
+        PDF rendering is CPU bound, so slips are built in a process pool.
+
+        Args:
+            orders: eBay order information for each slip
+
+        Returns:
+            Paths to the generated PDFs (None where generation failed), in
+            the same order as the input
+        """
+        if len(orders) <= 1:
+            return [self.generate_packing_slip(order) for order in orders]
+
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(orders)),
+            initializer=_init_worker,
+            initargs=(self.config,),
+        ) as executor:
+            results = list(executor.map(_generate_in_worker, orders))
+
+        # The workers overwrote these files, so record what they now contain
+        for order, path in zip(orders, results):
+            if path:
+                self._remember_slip(order["order_id"], self._content_key(order), path)
+        return results
+
+    def _remember_slip(self, order_id: str, content_key: str, path: Path) -> None:
+        """Record a generated or reused slip, forgetting the oldest beyond the cap"""
+        # Re-insert so the dict stays ordered by last use
+        self._generated.pop(order_id, None)
+        self._generated[order_id] = (content_key, path)
+        while len(self._generated) > self.MAX_REUSABLE_SLIPS:
+            del self._generated[next(iter(self._generated))]
+
+    @staticmethod
+    def _content_key(order_data: Dict[str, Any]) -> str:
+        """Hash the fields that end up on the packing slip"""
+        content = json.dumps(
+            [
+                order_data.get("order_id"),
+                order_data.get("buyer_address"),
+                order_data.get("items"),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    def _make_doc(self, output: BinaryIO) -> "reportlab.platypus.SimpleDocTemplate":
+        """Create the PDF document for a packing slip, rendering into output"""
+        return reportlab.platypus.SimpleDocTemplate(output, pagesize=self.PAGESIZE)
+
     def _build_pdf_content(self, order_data: Dict[str, Any], order_id: str) -> list:
         """
         Build the PDF content for the packing slip
@@ -95,10 +207,7 @@ class PackingSlipGenerator:
             List of reportlab story elements
         """
         story = []
-        styles = reportlab.lib.styles.getSampleStyleSheet()
-
-        # Get custom styles
-        title_style, header_style = self._get_pdf_styles(styles)
+        styles, title_style, header_style = self._get_cached_styles()
 
         # Add title
         story.append(reportlab.platypus.Paragraph("PACKING SLIP", title_style))
@@ -118,7 +227,20 @@ class PackingSlipGenerator:
 
         return story
 
-    def _get_pdf_styles(self, styles):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_cached_styles() -> Tuple[Any, Any, Any]:
+        """
+        Get the stylesheet and custom styles
+
+        They do not depend on the config, so they are built on first use and
+        shared by every generator.
+        """
+        styles = reportlab.lib.styles.getSampleStyleSheet()
+        return (styles, *PackingSlipGenerator._get_pdf_styles(styles))
+
+    @staticmethod
+    def _get_pdf_styles(styles):
         """Get custom PDF styles"""
         title_style = reportlab.lib.styles.ParagraphStyle(
             "CustomTitle",
@@ -146,10 +268,10 @@ class PackingSlipGenerator:
         buyer_address = order_data.get("buyer_address", {})
         if buyer_address:
             story.append(reportlab.platypus.Paragraph("Ship To:", header_style))
-            formatted_address = self._format_address(buyer_address)
-            for line in formatted_address.split("\n"):
-                if line.strip():
-                    story.append(reportlab.platypus.Paragraph(line, styles["Normal"]))
+            for line in self._format_address_lines(buyer_address):
+                story.append(
+                    reportlab.platypus.Paragraph(html.escape(line), styles["Normal"])
+                )
             story.append(reportlab.platypus.Spacer(1, 20))
 
     def _add_items_list(
@@ -159,11 +281,13 @@ class PackingSlipGenerator:
         items = order_data.get("items", [])
         if items:
             story.append(reportlab.platypus.Paragraph("Items:", header_style))
-            for item in items:
-                title = item.get("title", "Unknown Item")
-                quantity = item.get("quantity", 1)
-                item_text = f"• {title} (Qty: {quantity})"
-                story.append(reportlab.platypus.Paragraph(item_text, styles["Normal"]))
+            # One paragraph for all items keeps the flowable count constant
+            items_text = "<br/>".join(
+                f"• {html.escape(str(item.get('title', 'Unknown Item')))}"
+                f" (Qty: {item.get('quantity', 1)})"
+                for item in items
+            )
+            story.append(reportlab.platypus.Paragraph(items_text, styles["Normal"]))
             story.append(reportlab.platypus.Spacer(1, 20))
 
     def _format_address(self, address_data: Dict[str, Any]) -> str:
@@ -176,53 +300,41 @@ class PackingSlipGenerator:
         Returns:
             Formatted address string
         """
-        if not address_data:
-            return ""
+        return "\n".join(self._format_address_lines(address_data))
 
-        # Extract address components with safe defaults
-        name = address_data.get("name", "")
-        street1 = address_data.get("street1", "")
-        street2 = address_data.get("street2", "")
-        city = address_data.get("city", "")
-        state = address_data.get("state", "")
-        postal_code = address_data.get("postal_code", "")
-        country = address_data.get("country", "")
+    def _format_address_lines(self, address_data: Dict[str, Any]) -> List[str]:
+        """
+        Format shipping address as display lines
 
-        # Build formatted address
-        address_lines = []
+        Args:
+            address_data: Address information from eBay order
 
-        if name:
-            address_lines.append(name)
+        Returns:
+            Non-empty address lines
+        """
+        if not address_data:
+            return []
 
-        if street1:
-            address_lines.append(street1)
+        get = address_data.get
 
-        if street2:
-            address_lines.append(street2)
+        # Name and street lines, skipping any that are missing
+        address_lines = [
+            line for line in (get("name"), get("street1"), get("street2")) if line
+        ]
 
         # City, State ZIP format
-        city_line_parts = []
-        if city:
-            city_line_parts.append(city)
-        if state:
-            city_line_parts.append(state)
-        if postal_code:
-            city_line_parts.append(postal_code)
-
-        if city_line_parts:
-            if len(city_line_parts) == 3:  # city, state, zip
-                address_lines.append(
-                    f"{city_line_parts[0]}, {city_line_parts[1]} {city_line_parts[2]}"
-                )
-            else:
-                address_lines.append(" ".join(city_line_parts))
+        city, state, postal_code = get("city"), get("state"), get("postal_code")
+        if city and state and postal_code:
+            address_lines.append(f"{city}, {state} {postal_code}")
+        elif city or state or postal_code:
+            address_lines.append(" ".join(filter(None, (city, state, postal_code))))
 
+        country = get("country")
         if country and country.upper() != "US":
             address_lines.append(country)
 
-        return "\n".join(address_lines)
+        return address_lines
 
     def validate_order_data(self, order_data: Dict[str, Any]) -> bool:
         """Validate that order data contains required fields for packing slip generation"""
-        required_fields = ["order_id", "buyer_address"]
-        return all(field in order_data for field in required_fields)
+        return self.REQUIRED_FIELDS <= order_data.keys()
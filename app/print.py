@@ -34,17 +34,79 @@ class PrintManager:
             True if all documents printed successfully, False otherwise
         """
         if self.config.DRY_RUN:
-            logger.info("DRY RUN: Would print %d documents", len(pdf_paths))
-            for path in pdf_paths:
-                logger.info("DRY RUN: Would print %s", path)
+            logger.info(
+                "DRY RUN: Would print %d documents: %s",
+                len(pdf_paths),
+                ", ".join(map(str, pdf_paths)),
+            )
             return True
 
-        success = True
-        for pdf_path in pdf_paths:
-            if not self._print_single_pdf(pdf_path):
-                success = False
+        if len(pdf_paths) <= 1:
+            return all(self._print_single_pdf(path) for path in pdf_paths)
 
-        return success
+        # Submitting every document as one lp job pays the CUPS spool and
+        # IPP round trip once for the whole batch
+        if self.print_batch(pdf_paths):
+            return True
+        logger.warning(
+            "Batch print failed, printing %d documents individually", len(pdf_paths)
+        )
+
+        # Submit one job at a time, in order, so each order's label and slip
+        # still come out of the printer together; every file is attempted
+        results = [self._print_single_pdf(path) for path in pdf_paths]
+        return all(results)
+
+    def print_batch(self, pdf_paths: List[Path]) -> bool:
+        """
+        Print several PDFs to the CUPS printer as a single job
+
+        Unlike print_documents, nothing is retried per document if the job
+        fails, so callers can fall back to printing in smaller groups.
+
+        Args:
+            pdf_paths: List of PDF file paths to print, in print order
+
+        Returns:
+            True if the job was accepted, False otherwise
+        """
+        if self.config.DRY_RUN:
+            logger.info(
+                "DRY RUN: Would print %d documents as one job: %s",
+                len(pdf_paths),
+                ", ".join(map(str, pdf_paths)),
+            )
+            return True
+
+        try:
+            logger.info(
+                "Printing %d documents to %s as one job",
+                len(pdf_paths),
+                self.config.PRINTER_NAME,
+            )
+            subprocess.run(
+                self._lp_command(pdf_paths), capture_output=True, text=True, check=True
+            )
+            logger.info("Successfully printed %d documents", len(pdf_paths))
+            return True
+
+        except subprocess.CalledProcessError as e:
+            logger.error("Batch print command failed: %s", e.stderr or e)
+            return False
+        except (OSError, FileNotFoundError) as e:
+            logger.error("System error printing batch: %s", e)
+            return False
+
+    def _lp_command(self, pdf_paths: List[Path]) -> List[str]:
+        """Build the lp command that prints pdf_paths to the configured printer"""
+        return [
+            "lp",
+            "-h",
+            self.config.CUPS_SERVER_URI,
+            "-d",
+            self.config.PRINTER_NAME,
+            *map(str, pdf_paths),
+        ]
 
     def _print_single_pdf(self, pdf_path: Path) -> bool:
         """
@@ -56,20 +118,9 @@ class PrintManager:
         Returns:
             True if printed successfully, False otherwise
         """
-        if not pdf_path.exists():
-            logger.error("PDF file not found: %s", pdf_path)
-            return False
-
         try:
             # Use lp command to print to CUPS server
-            cmd = [
-                "lp",
-                "-h",
-                self.config.CUPS_SERVER_URI,
-                "-d",
-                self.config.PRINTER_NAME,
-                str(pdf_path),
-            ]
+            cmd = self._lp_command([pdf_path])
 
             logger.info("Printing %s to %s", pdf_path, self.config.PRINTER_NAME)
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
@@ -81,7 +132,11 @@ class PrintManager:
             return False
 
         except subprocess.CalledProcessError as e:
-            logger.error("Print command failed for %s: %s", pdf_path, e)
+            # lp reports a missing file itself, so there is no need to stat it first
+            if e.stderr and "No such file" in e.stderr:
+                logger.error("PDF file not found: %s", pdf_path)
+            else:
+                logger.error("Print command failed for %s: %s", pdf_path, e)
             return False
         except (OSError, FileNotFoundError) as e:
             logger.error("System error printing %s: %s", pdf_path, e)
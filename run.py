@@ -10,35 +10,56 @@ Orchestrates the full automation cycle:
 """
 
 import logging
+import logging.config
+import signal
 import sys
-import time
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from app.config import Config
+from app.config import get_config
 from app.orders import OrderManager
 from app.labels import LabelManager
 from app.packing import PackingSlipGenerator
 from app.print import PrintManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('ebay_printer.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'},
+    },
+    'handlers': {
+        # Rotated so a long-running container doesn't grow the log forever;
+        # delay opens the file on the first record rather than at startup
+        'file': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': 'ebay_printer.log',
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5,
+            'delay': True,
+            'formatter': 'default',
+        },
+        'stdout': {
+            'class': 'logging.StreamHandler',
+            'stream': 'ext://sys.stdout',
+            'formatter': 'default',
+        },
+    },
+    'root': {'level': 'INFO', 'handlers': ['file', 'stdout']},
+}
+
 
 def main():
     """Main application loop"""
+    # Configure logging here rather than at import, so importing this module
+    # doesn't open the log file
+    logging.config.dictConfig(LOGGING_CONFIG)
     logger.info("Starting eBay Label Printer application")
     
     # Load configuration
-    config = Config()
+    config = get_config()
     
     # Validate configuration
     if not config.validate():
@@ -58,22 +79,54 @@ def main():
     
     logger.info("Application started. Polling interval: %ds", config.POLLING_INTERVAL)
     logger.info("Dry run mode: %s", config.DRY_RUN)
+    logger.info("Max concurrency: %d", config.MAX_CONCURRENCY)
     
+    # SIGTERM (docker stop) wakes the sleep below, so shutdown doesn't wait out
+    # the polling interval; an in-progress batch still finishes first
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
     try:
-        while True:
-            process_orders(order_manager, label_manager, packing_generator, print_manager)
+        while not stop.is_set():
+            process_orders(config, order_manager, label_manager, packing_generator, print_manager)
             
-            logger.info("Sleeping for %ds...", config.POLLING_INTERVAL)
-            time.sleep(config.POLLING_INTERVAL)
+            interval = order_manager.compute_next_interval()
+            logger.info("Sleeping for %ds...", interval)
+            stop.wait(interval)
+
+        logger.info("Application stopped by signal")
             
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
     except Exception as e:
         logger.error("Unexpected error: %s", e)
         sys.exit(1)
+    finally:
+        label_manager.close()
+
+
+def buy_order_label(order, label_manager):
+    """Buy the shipping label for a single order
+
+    Returns:
+        Path to the label PDF, or None if the purchase failed
+    """
+    order_id = order.get('OrderID', 'unknown')
+    logger.info("Processing order %s", order_id)
+
+    try:
+        label_info = label_manager.buy_shipping_label(order)
+        if not label_info:
+            logger.error("Failed to buy label for order %s", order_id)
+            return None
+        return label_info['pdf_path']
+
+    except Exception as e:
+        logger.error("Error processing order %s: %s", order_id, e)
+        return None
 
 
-def process_orders(order_manager, label_manager, packing_generator, print_manager):
+def process_orders(config, order_manager, label_manager, packing_generator, print_manager):
     """Process new orders through the full pipeline"""
     logger.info("Checking for new orders...")
     
@@ -86,29 +139,51 @@ def process_orders(order_manager, label_manager, packing_generator, print_manage
             return
         
         logger.info("Found %d new orders", len(new_orders))
-        
-        for order in new_orders:
+
+        # Label purchases/downloads are network bound, so buy labels
+        # concurrently. Each order's label and packing slip are queued next to
+        # each other below so they come out of the printer together.
+        with ThreadPoolExecutor(max_workers=min(config.MAX_CONCURRENCY, len(new_orders))) as executor:
+            label_paths = list(executor.map(
+                lambda order: buy_order_label(order, label_manager),
+                new_orders,
+            ))
+
+        # Packing slips are CPU bound, so render them as one process-pool batch
+        labelled = [(order, path) for order, path in zip(new_orders, label_paths) if path]
+        try:
+            slip_paths = packing_generator.generate_packing_slips([order for order, _ in labelled])
+        except Exception as e:
+            # A broken pool (worker killed, unpicklable data, process limits)
+            # shouldn't lose the poll's orders, so render them in-process instead
+            logger.warning("Batch packing slip generation failed, generating one by one: %s", e)
+            slip_paths = [packing_generator.generate_packing_slip(order) for order, _ in labelled]
+
+        ready = []
+        for (order, label_path), slip_path in zip(labelled, slip_paths):
             order_id = order.get('OrderID', 'unknown')
-            logger.info("Processing order %s", order_id)
-            
+            if not slip_path:
+                logger.error("Failed to generate packing slip for order %s", order_id)
+                continue
+            ready.append((order_id, [label_path, slip_path]))
+
+        # Send the whole poll's documents to CUPS as one job
+        if len(ready) > 1 and print_manager.print_batch(
+            [path for _, pdf_paths in ready for path in pdf_paths]
+        ):
+            for order_id, _ in ready:
+                order_manager.mark_order_processed(order_id)
+                logger.info("Successfully processed order %s", order_id)
+            return
+
+        # Otherwise print order by order, so one bad order doesn't hold up the rest
+        for order_id, pdf_paths in ready:
             try:
-                # Buy shipping label
-                label_info = label_manager.buy_shipping_label(order)
-                if not label_info:
-                    logger.error("Failed to buy label for order %s", order_id)
-                    continue
-                
-                # Generate packing slip
-                packing_slip_path = packing_generator.generate_packing_slip(order)
-                if not packing_slip_path:
-                    logger.error("Failed to generate packing slip for order %s", order_id)
-                    continue
-                
                 # Print documents
-                pdf_paths = [Path(label_info['pdf_path']), packing_slip_path]
                 success = print_manager.print_documents(pdf_paths)
                 
                 if success:
+                    order_manager.mark_order_processed(order_id)
                     logger.info("Successfully processed order %s", order_id)
                 else:
                     logger.error("Failed to print documents for order %s", order_id)
@@ -6,14 +6,15 @@ import os
 from unittest.mock import Mock, patch
 import pytest
 from app.config import Config
+from app.orders import OrderManager
 
 
 @pytest.fixture
 def mock_ebay_apis():
     """Mock all eBay SDK APIs for testing"""
-    with patch("app.ebay_client.TradingAPI") as mock_trading, patch(
-        "app.ebay_client.FindingAPI"
-    ) as mock_finding, patch("app.ebay_client.ShoppingAPI") as mock_shopping:
+    with patch("ebaysdk.trading.Connection") as mock_trading, patch(
+        "ebaysdk.finding.Connection"
+    ) as mock_finding, patch("ebaysdk.shopping.Connection") as mock_shopping:
         yield {
             "trading": mock_trading,
             "finding": mock_finding,
@@ -28,6 +29,11 @@ def mock_config():
     config.STATE_FILE = "test_state.json"
     config.EBAY_ENVIRONMENT = "sandbox"
     config.EBAY_SITE_ID = "0"
+    config.EBAY_API_DOMAIN = "api.sandbox.ebay.com"
+    config.EBAY_SKIP_INIT = False
+    config.POLLING_INTERVAL = 300
+    config.POLLING_MAX_INTERVAL = 1800
+    config.MAX_CONCURRENCY = 8
     config.current_client_id = "test_client_id"
     config.current_dev_id = "test_dev_id"
     config.current_client_secret = "test_client_secret"
@@ -49,7 +55,7 @@ def real_config_sandbox():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def real_config_production():
     """Create a real Config object for production API testing"""
     # Set environment to production for testing
@@ -61,3 +67,21 @@ def real_config_production():
         pytest.skip("Production eBay API credentials not configured")
 
     return config
+
+
+@pytest.fixture(scope="session")
+def production_trading_api(
+    real_config_production,
+):  # pylint: disable=redefined-outer-name
+    """Share one Trading API connection (and its keep-alive session) across tests"""
+    return OrderManager(real_config_production).trading_api
+
+
+@pytest.fixture
+def production_order_manager(
+    real_config_production, production_trading_api
+):  # pylint: disable=redefined-outer-name
+    """Create a fresh OrderManager per test that reuses the shared connection"""
+    manager = OrderManager(real_config_production)
+    manager.trading_api = production_trading_api
+    return manager
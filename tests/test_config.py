@@ -5,7 +5,9 @@ Tests for configuration management
 import os
 from unittest.mock import patch
 
-from app.config import Config
+import pytest
+
+from app.config import Config, get_config
 
 
 class TestConfig:
@@ -91,3 +93,44 @@ class TestConfig:
         config = Config()
         # Should fail because it only has client_id but missing client_secret and dev_id for sandbox
         assert config.validate() is False
+
+    def test_get_config_returns_shared_instance(self):
+        """Test that get_config only builds the configuration once"""
+        get_config.cache_clear()
+        try:
+            assert get_config() is get_config()
+        finally:
+            get_config.cache_clear()
+
+    @patch.dict(
+        os.environ,
+        {
+            "EBAY_ENVIRONMENT": "production",
+            "EBAY_CLIENT_ID": "prod_client_id",
+            "EBAY_AUTH_TOKEN": "prod_auth_token",
+        },
+    )
+    def test_current_credentials_follow_environment(self):
+        """Test that current_* properties resolve to the active environment"""
+        config = Config()
+
+        assert config.current_client_id == "prod_client_id"
+        assert config.current_auth_token == "prod_auth_token"
+        assert config.EBAY_API_DOMAIN == "api.ebay.com"
+
+    def test_max_concurrency(self):
+        """Test that MAX_CONCURRENCY defaults to 8 and is at least 1"""
+        with patch.dict(os.environ, {}, clear=True):
+            assert Config().MAX_CONCURRENCY == 8
+        with patch.dict(os.environ, {"MAX_CONCURRENCY": "3"}, clear=True):
+            assert Config().MAX_CONCURRENCY == 3
+        with patch.dict(os.environ, {"MAX_CONCURRENCY": "0"}, clear=True):
+            assert Config().MAX_CONCURRENCY == 1
+
+    def test_config_uses_slots(self):
+        """Test that Config rejects unknown attributes instead of growing a dict"""
+        config = Config()
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            setattr(config, "NOT_A_SETTING", True)
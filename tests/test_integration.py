@@ -15,8 +15,10 @@ from app.print import PrintManager
 class TestPackingAndPrintingIntegration:
     """Test integration between packing slip generation and printing"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Set up test fixtures, writing slips under a temporary directory"""
+        monkeypatch.chdir(tmp_path)
         self.config = Mock(spec=Config)
         self.config.DRY_RUN = False
 
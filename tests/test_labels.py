@@ -3,6 +3,10 @@ Tests for shipping label management
 """
 # pylint: disable=assignment-from-none, attribute-defined-outside-init, protected-access, unused-argument
 
+import io
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 from app.labels import LabelManager
 
@@ -60,3 +64,63 @@ class TestLabelManager:
 
         result = label_manager.download_label_pdf(label_url, order_id)
         assert result is None
+
+    def test_download_label_pdf_reuses_session(
+        self, mock_config, mock_ebay_apis, tmp_path, monkeypatch
+    ):
+        """Test that label downloads go through the shared HTTP session"""
+        monkeypatch.chdir(tmp_path)
+        label_manager = LabelManager(mock_config)
+        mock_get = MagicMock()
+        mock_get.return_value.__enter__.side_effect = lambda: Mock(
+            raw=io.BytesIO(b"%PDF-1.4")
+        )
+        label_manager._http.get = mock_get
+
+        first = label_manager.download_label_pdf("https://example.com/a", "111")
+        second = label_manager.download_label_pdf("https://example.com/b", "222")
+
+        assert first is not None and first.read_bytes() == b"%PDF-1.4"
+        assert second is not None
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["stream"] is True
+
+    def test_http_pool_sized_to_concurrency(self, mock_config, mock_ebay_apis):
+        """Test that the download pool holds a connection per order worker"""
+        mock_config.MAX_CONCURRENCY = 12
+        label_manager = LabelManager(mock_config)
+
+        adapter = label_manager._http.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 12
+
+        label_manager.close()
+
+    def test_download_label_pdf_interrupted(
+        self, mock_config, mock_ebay_apis, tmp_path, monkeypatch
+    ):
+        """Test that a failed download leaves no partial label on disk"""
+        monkeypatch.chdir(tmp_path)
+        label_manager = LabelManager(mock_config)
+        broken_stream = Mock()
+        broken_stream.read.side_effect = OSError("connection reset")
+        mock_get = MagicMock()
+        mock_get.return_value.__enter__.return_value = Mock(raw=broken_stream)
+        label_manager._http.get = mock_get
+
+        result = label_manager.download_label_pdf("https://example.com/a", "333")
+
+        assert result is None
+        assert not list((tmp_path / "data" / "labels").iterdir())
+
+    def test_create_test_label_pdf_failed_write(
+        self, mock_config, mock_ebay_apis, tmp_path, monkeypatch
+    ):
+        """Test that a failed test label write leaves no temporary file"""
+        monkeypatch.chdir(tmp_path)
+        label_manager = LabelManager(mock_config)
+
+        with patch("app.labels.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                label_manager.create_test_label_pdf("444", "TRACK444")
+
+        assert not list((tmp_path / "data" / "labels").iterdir())
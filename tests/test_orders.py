@@ -2,13 +2,15 @@
 Tests for order management functionality
 """
 # pylint: disable=attribute-defined-outside-init, protected-access, unused-argument
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from pathlib import Path
-import tempfile
+from unittest.mock import Mock, patch
 
 import pytest
+from ebaysdk.exception import ConnectionError as EbayConnectionError
 
-from app.orders import OrderManager
+from app.orders import BACKOFF_JITTER, ORDER_LOOKBACK, OrderManager
 
 
 class TestOrderManager:
@@ -19,17 +21,339 @@ class TestOrderManager:
         manager = OrderManager(mock_config)
         assert manager.config == mock_config
 
+    def test_init_builds_sdk_connections(self, mock_config, mock_ebay_apis):
+        """Test that the lazily imported SDK connections are constructed"""
+        manager = OrderManager(mock_config)
+        assert manager.trading_api is mock_ebay_apis["trading"].return_value
+        assert manager.finding_api is mock_ebay_apis["finding"].return_value
+        assert manager.shopping_api is mock_ebay_apis["shopping"].return_value
+
+    def test_init_skips_sdk_when_disabled(self, mock_config, mock_ebay_apis):
+        """Test that EBAY_SKIP_INIT avoids creating SDK connections"""
+        mock_config.EBAY_SKIP_INIT = True
+        manager = OrderManager(mock_config)
+
+        assert manager.trading_api is None
+        mock_ebay_apis["trading"].assert_not_called()
+        mock_config.validate.assert_not_called()
+
     def test_poll_new_orders_placeholder(self, mock_config, mock_ebay_apis):
         """Test placeholder implementation of order polling"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            state_file = Path(tmpdir) / "test_state.json"
-            mock_config.STATE_FILE = str(state_file)
+        manager = OrderManager(mock_config)
+        manager.trading_api = None
+
+        # Should return empty list when trading API is None (not initialized)
+        assert not manager.poll_new_orders()
+
+    def test_poll_new_orders_request_window(self, mock_config, mock_ebay_apis):
+        """Test that GetOrders is called with a 7-day UTC window"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        manager.trading_api.execute.return_value.reply.Ack = "Failure"
+
+        manager.poll_new_orders()
+
+        api_request = manager.trading_api.execute.call_args[0][1]
+        time_format = "%Y-%m-%dT%H:%M:%S.000Z"
+        from_date = datetime.strptime(api_request["CreateTimeFrom"], time_format)
+        to_date = datetime.strptime(api_request["CreateTimeTo"], time_format)
+        assert to_date - from_date == timedelta(days=7)
+        assert api_request["OrderStatus"] == "Completed"
+        assert api_request["Pagination"] == {"EntriesPerPage": 50, "PageNumber": 1}
+        assert (
+            api_request["Pagination"]
+            is not OrderManager._GET_ORDERS_REQUEST["Pagination"]
+        )
+
+    def test_poll_new_orders_skips_processed_orders(self, mock_config, mock_ebay_apis):
+        """Test that orders marked as processed are not returned again"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        response = manager.trading_api.execute.return_value
+        response.reply.Ack = "Success"
+        response.dict.return_value = {
+            "OrderArray": {
+                "Order": [
+                    {"OrderID": "1", "OrderStatus": "Completed"},
+                    {"OrderID": "2", "OrderStatus": "Completed"},
+                ]
+            }
+        }
+
+        manager.mark_order_processed("1")
+
+        assert manager.is_order_seen("1")
+        assert not manager.is_order_seen("2")
+        assert [o["OrderID"] for o in manager.poll_new_orders()] == ["2"]
+
+    def test_processed_orders_expire_after_lookback(self, mock_config, mock_ebay_apis):
+        """Test that processed orders older than the lookback window are dropped"""
+        manager = OrderManager(mock_config)
+        lookback = ORDER_LOOKBACK.total_seconds()
+
+        with patch("app.orders.time.monotonic", return_value=1000.0):
+            manager.mark_order_processed("old")
+            manager.mark_order_processed("renewed")
+        with patch("app.orders.time.monotonic", return_value=1000.0 + lookback / 2):
+            manager.mark_order_processed("renewed")
+        with patch("app.orders.time.monotonic", return_value=1001.0 + lookback):
+            manager.mark_order_processed("new")
+
+        assert not manager.is_order_seen("old")
+        assert manager.is_order_seen("renewed")
+        assert manager.is_order_seen("new")
+
+    @pytest.mark.parametrize(
+        "payload, expected_ids",
+        [
+            (
+                {"OrderArray": {"Order": [{"OrderID": "1"}, {"OrderID": "2"}]}},
+                ["1", "2"],
+            ),
+            ({"OrderArray": {"Order": {"OrderID": "1"}}}, ["1"]),
+            ({"OrderArray": None}, []),
+            ({}, []),
+        ],
+    )
+    def test_extract_orders_from_response(self, payload, expected_ids):
+        """Test that single, multiple and missing orders are normalized to a list"""
+        response = Mock()
+        response.reply.Ack = "Success"
+        response.dict.return_value = payload
+
+        orders = OrderManager.extract_orders_from_response(response)
+        assert [order["OrderID"] for order in orders] == expected_ids
+
+    def test_poll_new_orders_fetches_all_pages(self, mock_config, mock_ebay_apis):
+        """Test that remaining GetOrders pages are fetched and merged"""
+
+        def make_response(page_number):
+            response = Mock()
+            response.reply.Ack = "Success"
+            response.dict.return_value = {
+                "OrderArray": {
+                    "Order": {
+                        "OrderID": f"page-{page_number}",
+                        "OrderStatus": "Completed",
+                    }
+                },
+                "PaginationResult": {"TotalNumberOfPages": "3"},
+            }
+            return response
+
+        def execute(_verb, api_request):
+            return make_response(api_request["Pagination"]["PageNumber"])
+
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        manager.trading_api.execute.side_effect = execute
+        page_api = Mock()
+        page_api.execute.side_effect = execute
 
-            manager = OrderManager(mock_config)
+        with patch.object(manager, "_create_trading_api", return_value=page_api):
             orders = manager.poll_new_orders()
 
-            # Should return empty list when trading API is None (not initialized)
-            assert not orders
+        assert [o["OrderID"] for o in orders] == ["page-1", "page-2", "page-3"]
+        assert page_api.execute.call_count == 2
+        # The shared request template is left untouched
+        assert OrderManager._GET_ORDERS_REQUEST["Pagination"]["PageNumber"] == 1
+
+    def test_poll_new_orders_drops_duplicates_across_pages(
+        self, mock_config, mock_ebay_apis
+    ):
+        """Test that an order that moved across a page boundary is returned once"""
+        pages = {
+            1: [{"OrderID": "A", "OrderStatus": "Completed", "Page": 1}],
+            # A shifted onto page 2 between the two requests
+            2: [
+                {"OrderID": "A", "OrderStatus": "Completed", "Page": 2},
+                {"OrderID": "B", "OrderStatus": "Completed", "Page": 2},
+            ],
+        }
+
+        def execute(_verb, api_request):
+            response = Mock()
+            response.reply.Ack = "Success"
+            response.dict.return_value = {
+                "OrderArray": {"Order": pages[api_request["Pagination"]["PageNumber"]]},
+                "PaginationResult": {"TotalNumberOfPages": "2"},
+            }
+            return response
+
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        manager.trading_api.execute.side_effect = execute
+        page_api = Mock()
+        page_api.execute.side_effect = execute
+
+        with patch.object(manager, "_create_trading_api", return_value=page_api):
+            orders = manager.poll_new_orders()
+
+        # The first copy seen is kept
+        assert [(o["OrderID"], o["Page"]) for o in orders] == [("A", 1), ("B", 2)]
+
+
+class TestPollingBackoff:
+    """Test adaptive poll interval computation"""
+
+    @patch("app.orders.random.uniform", return_value=0.0)
+    def test_interval_starts_at_base(self, _mock_uniform, mock_config, mock_ebay_apis):
+        """Test that a fresh manager waits the configured polling interval"""
+        manager = OrderManager(mock_config)
+        assert manager.compute_next_interval() == 300
+
+    @patch("app.orders.random.uniform", return_value=0.0)
+    def test_interval_backs_off_on_errors(
+        self, _mock_uniform, mock_config, mock_ebay_apis
+    ):
+        """Test that consecutive API errors grow the interval up to the cap"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        manager.trading_api.execute.side_effect = EbayConnectionError("boom")
+
+        manager.poll_new_orders()
+        assert manager.compute_next_interval() == pytest.approx(300 * 1.3)
+
+        for _ in range(20):
+            manager.poll_new_orders()
+        assert manager.compute_next_interval() == 1800
+
+    @patch("app.orders.random.uniform", return_value=0.0)
+    def test_interval_resets_when_orders_found(
+        self, _mock_uniform, mock_config, mock_ebay_apis
+    ):
+        """Test that finding orders resets the backoff"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        response = manager.trading_api.execute.return_value
+        response.reply.Ack = "Success"
+        response.dict.return_value = {}
+
+        manager.poll_new_orders()
+        manager.poll_new_orders()
+        assert manager.compute_next_interval() == pytest.approx(300 * 1.3**2)
+
+        response.dict.return_value = {
+            "OrderArray": {"Order": {"OrderID": "1", "OrderStatus": "Completed"}}
+        }
+        manager.poll_new_orders()
+        assert manager.compute_next_interval() == 300
+
+    @pytest.mark.parametrize(
+        "order_count, expected",
+        [
+            (2, 300),  # Too little history, use POLLING_INTERVAL
+            (3, 7 * 24 * 3600 / 3 / 10),
+            (7, 7 * 24 * 3600 / 7 / 10),  # One order a day, poll every 2.4h
+            (49, 7 * 24 * 3600 / 49 / 10),
+            (50, 7 * 24 * 3600 / 50 / 10),
+            (500, 300),  # Every page full, real volume unknown
+        ],
+    )
+    @patch("app.orders.random.uniform", return_value=0.0)
+    def test_interval_adapts_to_order_volume(
+        self, _mock_uniform, order_count, expected, mock_config, mock_ebay_apis
+    ):
+        """Test that the base interval follows the recent order arrival rate"""
+        mock_config.POLLING_MAX_INTERVAL = 24 * 3600
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        response = manager.trading_api.execute.return_value
+        response.reply.Ack = "Success"
+        response.dict.return_value = {
+            "OrderArray": {
+                "Order": [
+                    {"OrderID": str(i), "OrderStatus": "Completed"}
+                    for i in range(order_count)
+                ]
+            }
+        }
+
+        manager.poll_new_orders()
+        assert manager.compute_next_interval() == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "order_count, expected",
+        [
+            (2, 300),  # Below MIN_ORDERS_FOR_ESTIMATE
+            (3, 1800 / 1.3**2),  # Capped, leaving two backoff steps
+            (7, 1800 / 1.3**2),
+        ],
+    )
+    @patch("app.orders.random.uniform", return_value=0.0)
+    def test_interval_estimate_is_capped(
+        self, _mock_uniform, order_count, expected, mock_config, mock_ebay_apis
+    ):
+        """Test that sparse history can't push the base interval to the cap"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        response = manager.trading_api.execute.return_value
+        response.reply.Ack = "Success"
+        response.dict.return_value = {
+            "OrderArray": {
+                "Order": [
+                    {"OrderID": str(i), "OrderStatus": "Completed"}
+                    for i in range(order_count)
+                ]
+            }
+        }
+
+        manager.poll_new_orders()
+        assert manager.compute_next_interval() == pytest.approx(expected)
+        assert manager.compute_next_interval() < mock_config.POLLING_MAX_INTERVAL
+
+    def test_interval_estimate_change_is_logged(
+        self, mock_config, mock_ebay_apis, caplog
+    ):
+        """Test that a new base interval is logged once, not on every poll"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        response = manager.trading_api.execute.return_value
+        response.reply.Ack = "Success"
+        response.dict.return_value = {
+            "OrderArray": {
+                "Order": [
+                    {"OrderID": str(i), "OrderStatus": "Completed"} for i in range(100)
+                ]
+            }
+        }
+
+        with caplog.at_level(logging.INFO, logger="app.orders"):
+            manager.poll_new_orders()
+            manager.poll_new_orders()
+
+        changes = [r for r in caplog.records if "Base poll interval" in r.message]
+        assert len(changes) == 1
+        assert "605s" in changes[0].message
+
+    @patch("app.orders.random.uniform", return_value=BACKOFF_JITTER)
+    def test_jitter_does_not_exceed_max_interval(
+        self, _mock_uniform, mock_config, mock_ebay_apis
+    ):
+        """Test that positive jitter on a long error streak stays under the cap"""
+        manager = OrderManager(mock_config)
+        manager.trading_api = Mock()
+        manager.trading_api.execute.side_effect = EbayConnectionError("boom")
+
+        for _ in range(20):
+            manager.poll_new_orders()
+        assert manager.compute_next_interval() == 1800
+
+    @patch("app.orders.random.uniform", return_value=BACKOFF_JITTER)
+    def test_very_long_streak_does_not_overflow(
+        self, _mock_uniform, mock_config, mock_ebay_apis
+    ):
+        """Test that months of empty polls still yield the capped interval"""
+        manager = OrderManager(mock_config)
+        manager._idle_streak = 3000
+        manager._err_streak = 3000
+        assert manager.compute_next_interval() == 1800
+
+    def test_interval_is_jittered(self, mock_config, mock_ebay_apis):
+        """Test that jitter stays within the configured bounds"""
+        manager = OrderManager(mock_config)
+        for _ in range(50):
+            assert 240 <= manager.compute_next_interval() <= 360
 
 
 class TestOrderManagerRealAPI:
@@ -56,9 +380,9 @@ class TestOrderManagerRealAPI:
             print(f"  Order {order_id}: Status={status}")
 
     @pytest.mark.api_production
-    def test_poll_new_orders_production(self, real_config_production):
+    def test_poll_new_orders_production(self, production_order_manager):
         """Test order polling against eBay production API"""
-        manager = OrderManager(real_config_production)
+        manager = production_order_manager
 
         # This should connect to the real production API
         assert manager.trading_api is not None
@@ -71,26 +395,23 @@ class TestOrderManagerRealAPI:
 
         print(f"Production API returned {len(orders)} orders")
         for order in orders[:3]:  # Show first 3 orders if any
-            order_id = order.get("OrderID", "Unknown")
-            status = order.get("OrderStatus", "Unknown")
-            buyer = order.get("BuyerUserID", "Unknown")
-            total = order.get("Total", {}).get("_value", "Unknown")
+            get = order.get
+            order_id = get("OrderID", "Unknown")
+            status = get("OrderStatus", "Unknown")
+            buyer = get("BuyerUserID", "Unknown")
+            total = (get("Total") or {}).get("_value", "Unknown")
             print(f"  Order {order_id}: Status={status}, Buyer={buyer}, Total=${total}")
 
     @pytest.mark.api_production
-    def test_fetch_recent_order_production(self, real_config_production):
+    def test_fetch_recent_order_production(self, production_order_manager):
         """Test fetching the most recent order from production API"""
-        manager = OrderManager(real_config_production)
+        manager = production_order_manager
 
         try:
             orders = manager.poll_new_orders()
             if orders:
-                # Sort by creation time to get most recent
-                sorted_orders = sorted(
-                    orders, key=lambda x: x.get("CreatedTime", ""), reverse=True
-                )
-
-                most_recent = sorted_orders[0]
+                # Most recent by creation time
+                most_recent = max(orders, key=lambda x: x.get("CreatedTime", ""))
                 order_id = most_recent.get("OrderID", "Unknown")
                 created_time = most_recent.get("CreatedTime", "Unknown")
                 buyer = most_recent.get("BuyerUserID", "Unknown")
@@ -113,42 +434,56 @@ class TestOrderManagerRealAPI:
             pass
 
     @pytest.mark.api_production
-    def test_debug_all_orders_production(self, real_config_production):
+    def test_debug_all_orders_production(self, production_order_manager):
         """Debug test to show ALL orders without filtering"""
-        manager = OrderManager(real_config_production)
+        manager = production_order_manager
 
         if not manager.trading_api:
             print("Trading API not initialized")
             return
 
         # Get orders from the last 7 days without any filtering
-        from_date = datetime.now() - timedelta(days=7)
-
-        # Try different order status values to see what exists
-        for order_status in ["Active", "Completed", "All"]:
-            print(f"\n=== Testing OrderStatus: {order_status} ===")
+        now = datetime.now()
+        from_str = (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        to_str = now.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
+        def fetch(order_status):
             api_request = {
-                "CreateTimeFrom": from_date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "CreateTimeTo": datetime.now().strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "CreateTimeFrom": from_str,
+                "CreateTimeTo": to_str,
                 "OrderStatus": order_status,
                 "Pagination": {"EntriesPerPage": 50, "PageNumber": 1},
             }
+            # Remove ListingType filter to see all types. Each request gets its
+            # own connection, since one SDK connection isn't thread safe
+            api = manager._create_trading_api()
+            return order_status, api.execute("GetOrders", api_request)
 
-            # Remove ListingType filter to see all types
-            response = manager.trading_api.execute("GetOrders", api_request)
+        # Try different order status values to see what exists
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(executor.map(fetch, ["Active", "Completed", "All"]))
+
+        for order_status, response in results:
+            print(f"\n=== Testing OrderStatus: {order_status} ===")
 
             orders = OrderManager.extract_orders_from_response(response)
             print(f"Found {len(orders)} orders with status '{order_status}'")
 
+            # Write each status's report in one go rather than a print per line
+            lines = []
             for order in orders:
-                print(f"  Order {order.get('OrderID', 'Unknown')}:")
-                print(f"    Status: {order.get('OrderStatus', 'Unknown')}")
-                print(f"    Created: {order.get('CreatedTime', 'Unknown')}")
-                print(f"    Buyer: {order.get('BuyerUserID', 'Unknown')}")
-                print(f"    Total: ${order.get('Total', {}).get('_value', 'Unknown')}")
-                print(f"    Shipped: {order.get('ShippedTime', 'None')}")
-                print(f"    ListingType: {order.get('ListingType', 'Unknown')}")
-                print()
+                get = order.get
+                lines += [
+                    f"  Order {get('OrderID', 'Unknown')}:",
+                    f"    Status: {get('OrderStatus', 'Unknown')}",
+                    f"    Created: {get('CreatedTime', 'Unknown')}",
+                    f"    Buyer: {get('BuyerUserID', 'Unknown')}",
+                    f"    Total: ${(get('Total') or {}).get('_value', 'Unknown')}",
+                    f"    Shipped: {get('ShippedTime', 'None')}",
+                    f"    ListingType: {get('ListingType', 'Unknown')}",
+                    "",
+                ]
+            if lines:
+                print("\n".join(lines))
 
             print(f"=== End {order_status} ===\n")
@@ -2,9 +2,13 @@
 Tests for packing slip generation
 """
 # pylint: disable=protected-access, attribute-defined-outside-init, assignment-from-none
+# pylint: disable=too-many-public-methods
 
 from unittest.mock import patch
 
+import pytest
+import reportlab.lib.styles  # type: ignore
+
 from app.config import Config
 from app.packing import PackingSlipGenerator
 
@@ -12,8 +16,10 @@ from app.packing import PackingSlipGenerator
 class TestPackingSlipGenerator:
     """Test packing slip generation functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Set up test fixtures, writing slips under a temporary directory"""
+        monkeypatch.chdir(tmp_path)
         self.config = Config()
         self.packing_generator = PackingSlipGenerator(self.config)
 
@@ -42,6 +48,8 @@ class TestPackingSlipGenerator:
         assert result is not None
         assert result.name == "packing_slip_12345-67890.pdf"
         assert result.exists()  # File should be created
+        assert result.read_bytes().startswith(b"%PDF")
+        assert not result.with_name(result.name + ".tmp").exists()
 
     def test_generate_packing_slip_with_missing_order_id(self):
         """Test generating packing slip with missing order ID"""
@@ -75,6 +83,19 @@ class TestPackingSlipGenerator:
         expected = "John Doe\n123 Main St\nAnytown, CA 12345"
         assert result == expected
 
+    def test_format_address_lines_includes_foreign_country(self):
+        """Test that address lines come back as a list, with non-US country"""
+        address_data = {
+            "name": "Jane Doe",
+            "street1": "1 High St",
+            "city": "London",
+            "postal_code": "SW1A 1AA",
+            "country": "GB",
+        }
+
+        result = self.packing_generator._format_address_lines(address_data)
+        assert result == ["Jane Doe", "1 High St", "London SW1A 1AA", "GB"]
+
     def test_format_address_with_empty_data(self):
         """Test formatting address with empty address data"""
         address_data = {}
@@ -113,6 +134,43 @@ class TestPackingSlipGenerator:
         result = self.packing_generator.validate_order_data(order_data)
         assert result is False
 
+    def test_items_rendered_as_one_escaped_paragraph(self):
+        """Test that all items share one paragraph and titles are escaped"""
+        order_data = {
+            "order_id": "ITEMS-1",
+            "buyer_address": {"name": "John Doe"},
+            "items": [
+                {"title": "Cables & Adapters <2m>", "quantity": 2},
+                {"title": "Widget"},
+            ],
+        }
+        assert self.packing_generator.generate_packing_slip(order_data) is not None
+
+        styles, _, header_style = self.packing_generator._get_cached_styles()
+        story = []
+        self.packing_generator._add_items_list(story, order_data, header_style, styles)
+        # Header, items paragraph, spacer
+        assert len(story) == 3
+        assert story[1].text == (
+            "• Cables &amp; Adapters &lt;2m&gt; (Qty: 2)<br/>• Widget (Qty: 1)"
+        )
+
+    def test_address_lines_are_escaped(self):
+        """Test that markup characters in the address render literally"""
+        order_data = {
+            "order_id": "ADDRESS-1",
+            "buyer_address": {"name": "Smith & Sons", "street1": "Unit <4>"},
+        }
+        assert self.packing_generator.generate_packing_slip(order_data) is not None
+
+        styles, _, header_style = self.packing_generator._get_cached_styles()
+        story = []
+        self.packing_generator._add_shipping_address(
+            story, order_data, header_style, styles
+        )
+        # Header, one paragraph per line, spacer
+        assert [p.text for p in story[1:-1]] == ["Smith &amp; Sons", "Unit &lt;4&gt;"]
+
     @patch("app.packing.logger")
     def test_generate_packing_slip_logs_correctly(self, mock_logger):
         """Test that generate_packing_slip logs the correct information"""
@@ -135,6 +193,120 @@ class TestPackingSlipGenerator:
             "Generating packing slip for order %s", "unknown"
         )
 
+    def test_styles_built_once(self):
+        """Test that the stylesheet is built lazily and shared across generators"""
+        PackingSlipGenerator._get_cached_styles.cache_clear()
+        order_data = {"order_id": "STYLE-1", "buyer_address": {"name": "John Doe"}}
+        with patch(
+            "reportlab.lib.styles.getSampleStyleSheet",
+            wraps=reportlab.lib.styles.getSampleStyleSheet,
+        ) as mock_get:
+            self.packing_generator.generate_packing_slip(order_data)
+        mock_get.assert_called_once()
+        styles = self.packing_generator._get_cached_styles()
+
+        other_generator = PackingSlipGenerator(self.packing_generator.config)
+        order_data["order_id"] = "STYLE-2"
+        with patch("reportlab.lib.styles.getSampleStyleSheet") as mock_get:
+            result = other_generator.generate_packing_slip(order_data)
+
+        assert result is not None
+        mock_get.assert_not_called()
+        assert other_generator._get_cached_styles() is styles
+
+    def test_generate_packing_slip_reuses_identical_slip(self):
+        """Test that an unchanged slip is not rendered again"""
+        order_data = {"order_id": "REUSE-1", "buyer_address": {"name": "John Doe"}}
+        first = self.packing_generator.generate_packing_slip(order_data)
+
+        with patch.object(self.packing_generator, "_make_doc") as mock_make_doc:
+            second = self.packing_generator.generate_packing_slip(dict(order_data))
+        assert second == first
+        mock_make_doc.assert_not_called()
+
+        # Changed content is rendered again
+        order_data["buyer_address"] = {"name": "Jane Doe"}
+        with patch.object(
+            self.packing_generator,
+            "_make_doc",
+            wraps=self.packing_generator._make_doc,
+        ) as mock_make_doc:
+            third = self.packing_generator.generate_packing_slip(order_data)
+        assert third == first
+        mock_make_doc.assert_called_once()
+
+        # Going back to the original content must not reuse the overwritten file
+        order_data["buyer_address"] = {"name": "John Doe"}
+        with patch.object(
+            self.packing_generator,
+            "_make_doc",
+            wraps=self.packing_generator._make_doc,
+        ) as mock_make_doc:
+            self.packing_generator.generate_packing_slip(order_data)
+        mock_make_doc.assert_called_once()
+
+    def test_generate_packing_slips_in_parallel(self):
+        """Test that batch generation returns one result per order, in order"""
+        orders = [
+            {"order_id": "BATCH-1", "buyer_address": {"name": "John Doe"}},
+            {"order_id": "BATCH-2"},  # Invalid, missing buyer_address
+            {"order_id": "BATCH-3", "buyer_address": {"name": "Jane Doe"}},
+        ]
+
+        results = self.packing_generator.generate_packing_slips(orders)
+
+        assert [r.name if r else None for r in results] == [
+            "packing_slip_BATCH-1.pdf",
+            None,
+            "packing_slip_BATCH-3.pdf",
+        ]
+        assert all(r.exists() for r in results if r)
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        """Test that a failed slip write cleans up its temporary file"""
+        order_data = {"order_id": "TMP-1", "buyer_address": {"name": "John Doe"}}
+
+        with patch("app.packing.os.replace", side_effect=OSError("disk full")):
+            assert self.packing_generator.generate_packing_slip(order_data) is None
+
+        assert not list(PackingSlipGenerator.OUTPUT_DIR.iterdir())
+
+    def test_reuse_cache_is_bounded(self):
+        """Test that only the most recent slips are remembered for reuse"""
+        with patch.object(PackingSlipGenerator, "MAX_REUSABLE_SLIPS", 2):
+            for order_id in ("CAP-1", "CAP-2", "CAP-1", "CAP-3"):
+                self.packing_generator.generate_packing_slip(
+                    {"order_id": order_id, "buyer_address": {"name": "John Doe"}}
+                )
+
+        # CAP-1 was reused, so CAP-2 is now the oldest and was forgotten
+        assert list(self.packing_generator._generated) == ["CAP-1", "CAP-3"]
+
+    def test_batch_generation_refreshes_reuse_cache(self):
+        """Test that a slip rewritten by a batch is not reused as stale"""
+        original = {"order_id": "MIXED-1", "buyer_address": {"name": "John Doe"}}
+        changed = {"order_id": "MIXED-1", "buyer_address": {"name": "Jane Doe"}}
+        other = {"order_id": "MIXED-2", "buyer_address": {"name": "Jim Doe"}}
+
+        first = self.packing_generator.generate_packing_slip(original)
+        self.packing_generator.generate_packing_slips([changed, other])
+
+        # The file now holds the changed address, so the original is re-rendered
+        with patch.object(
+            self.packing_generator,
+            "_make_doc",
+            wraps=self.packing_generator._make_doc,
+        ) as mock_make_doc:
+            again = self.packing_generator.generate_packing_slip(original)
+        assert again == first
+        mock_make_doc.assert_called_once()
+
+        # And the batch's own output is reused as-is
+        with patch.object(self.packing_generator, "_make_doc") as mock_make_doc:
+            reused = self.packing_generator.generate_packing_slip(dict(other))
+        assert reused is not None and reused.name == "packing_slip_MIXED-2.pdf"
+        mock_make_doc.assert_not_called()
+
     def test_config_dependency(self):
         """Test that PackingSlipGenerator properly uses the config object"""
         # Test that the generator stores and can access config
@@ -2,7 +2,6 @@
 Tests for printing functionality
 """
 # pylint: disable=protected-access, attribute-defined-outside-init
-import tempfile
 from pathlib import Path
 from subprocess import CalledProcessError
 from unittest.mock import Mock, patch, MagicMock
@@ -26,43 +25,53 @@ class TestPrintManager:
         manager = PrintManager(self.config)
         assert manager.config == self.config
 
-    def test_print_documents_dry_run(self):
+    def test_print_documents_dry_run(self, tmp_path):
         """Test dry run mode doesn't actually print"""
         self.config.DRY_RUN = True
         manager = PrintManager(self.config)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf1 = Path(tmpdir) / "test1.pdf"
-            pdf2 = Path(tmpdir) / "test2.pdf"
-            pdf1.touch()
-            pdf2.touch()
+        pdf1 = tmp_path / "test1.pdf"
+        pdf2 = tmp_path / "test2.pdf"
+        pdf1.touch()
+        pdf2.touch()
 
+        with patch("app.print.logger") as mock_logger:
             result = manager.print_documents([pdf1, pdf2])
-            assert result is True
+        assert result is True
+        # One summary line for the whole batch
+        mock_logger.info.assert_called_once_with(
+            "DRY RUN: Would print %d documents: %s", 2, f"{pdf1}, {pdf2}"
+        )
 
     @patch("app.print.subprocess.run")
-    def test_print_single_pdf_success(self, mock_run):
+    def test_print_single_pdf_success(self, mock_run, tmp_path):
         """Test successful printing of a single PDF"""
         mock_run.return_value = MagicMock(returncode=0)
         manager = PrintManager(self.config)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_file = Path(tmpdir) / "test.pdf"
-            pdf_file.touch()
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.touch()
 
-            result = manager._print_single_pdf(pdf_file)
-            assert result is True
+        result = manager._print_single_pdf(pdf_file)
+        assert result is True
 
-            # Verify correct command was called
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert args[0] == "lp"
-            assert "-h" in args and "localhost" in args
-            assert "-d" in args and "test_printer" in args
-            assert str(pdf_file) in args
+        # Verify correct command was called
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[0] == "lp"
+        assert "-h" in args and "localhost" in args
+        assert "-d" in args and "test_printer" in args
+        assert str(pdf_file) in args
 
-    def test_print_single_pdf_file_not_found(self):
+    @patch("app.print.subprocess.run")
+    def test_print_single_pdf_file_not_found(self, mock_run):
         """Test printing when PDF file doesn't exist"""
+        mock_run.side_effect = CalledProcessError(
+            1,
+            "lp",
+            stderr='lp: Error - unable to access "/nonexistent/file.pdf" - '
+            "No such file or directory",
+        )
         manager = PrintManager(self.config)
 
         nonexistent_file = Path("/nonexistent/file.pdf")
@@ -70,18 +79,93 @@ class TestPrintManager:
         assert result is False
 
     @patch("app.print.subprocess.run")
-    def test_print_single_pdf_command_failure(self, mock_run):
+    def test_print_single_pdf_command_failure(self, mock_run, tmp_path):
         """Test handling of print command failure"""
         mock_run.side_effect = CalledProcessError(1, "lp", stderr="Printer error")
 
         manager = PrintManager(self.config)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_file = Path(tmpdir) / "test.pdf"
-            pdf_file.touch()
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.touch()
+
+        result = manager._print_single_pdf(pdf_file)
+        assert result is False
+
+    @patch("app.print.subprocess.run")
+    def test_print_documents_single_job(self, mock_run, tmp_path):
+        """Test that a batch of PDFs is submitted to lp as one job"""
+        mock_run.return_value = MagicMock(returncode=0)
+        manager = PrintManager(self.config)
+
+        pdfs = [tmp_path / f"test{i}.pdf" for i in range(3)]
+        for pdf in pdfs:
+            pdf.touch()
+
+        assert manager.print_documents(pdfs) is True
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[0] == "lp"
+        assert args[-3:] == [str(pdf) for pdf in pdfs]
+
+    @patch("app.print.subprocess.run")
+    def test_print_batch_does_not_retry(self, mock_run):
+        """Test that a failed batch is reported without per-file retries"""
+        mock_run.side_effect = CalledProcessError(1, "lp", stderr="Printer error")
+        manager = PrintManager(self.config)
+
+        assert manager.print_batch([Path("a.pdf"), Path("b.pdf")]) is False
+        mock_run.assert_called_once()
+
+        self.config.DRY_RUN = True
+        mock_run.reset_mock()
+        assert manager.print_batch([Path("a.pdf"), Path("b.pdf")]) is True
+        mock_run.assert_not_called()
+
+    @patch("app.print.subprocess.run")
+    def test_print_documents_falls_back_to_individual_jobs(self, mock_run, tmp_path):
+        """Test that a failed batch job is retried per file"""
+        manager = PrintManager(self.config)
+
+        def fake_lp(cmd, **_kwargs):
+            if any(arg.endswith("bad.pdf") for arg in cmd):
+                raise CalledProcessError(1, "lp", stderr="Printer error")
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = fake_lp
+
+        good = tmp_path / "good.pdf"
+        bad = tmp_path / "bad.pdf"
+        good.touch()
+        bad.touch()
+
+        assert manager.print_documents([good, bad]) is False
+
+        # One batch attempt, then one job per file
+        assert mock_run.call_count == 3
+        individual = [call.args[0][-1] for call in mock_run.call_args_list[1:]]
+        assert individual == [str(good), str(bad)]
+
+    @patch("app.print.subprocess.run")
+    def test_print_documents_fallback_keeps_input_order(self, mock_run, tmp_path):
+        """Test that per-file retries are submitted one at a time, in order"""
+        manager = PrintManager(self.config)
+        paths = [tmp_path / f"{name}.pdf" for name in ("label", "slip", "c", "d")]
+        for path in paths:
+            path.touch()
+
+        submitted = []
+
+        def fake_lp(cmd, **_kwargs):
+            if len(cmd) > 6:
+                raise CalledProcessError(1, "lp", stderr="Printer error")
+            submitted.append(cmd[-1])
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = fake_lp
 
-            result = manager._print_single_pdf(pdf_file)
-            assert result is False
+        assert manager.print_documents(paths) is True
+        assert submitted == [str(path) for path in paths]
 
     @patch("app.print.subprocess.run")
     def test_test_printer_connection_success(self, mock_run):
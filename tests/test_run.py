@@ -0,0 +1,146 @@
+"""
+Tests for the order processing pipeline in run.py
+"""
+# pylint: disable=attribute-defined-outside-init
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from run import process_orders
+
+
+class TestProcessOrders:
+    """Test process_orders with mocked managers"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_config):
+        """Set up mocked managers for two orders"""
+        self.config = mock_config
+        self.orders = [{"OrderID": "A"}, {"OrderID": "B"}]
+        self.order_manager = Mock()
+        self.order_manager.poll_new_orders.return_value = self.orders
+        self.label_manager = Mock()
+        self.label_manager.buy_shipping_label.side_effect = lambda order: {
+            "pdf_path": Path(f"label_{order['OrderID']}.pdf")
+        }
+        self.packing_generator = Mock()
+        self.packing_generator.generate_packing_slips.side_effect = lambda orders: [
+            Path(f"slip_{order['OrderID']}.pdf") for order in orders
+        ]
+        self.packing_generator.generate_packing_slip.side_effect = lambda order: Path(
+            f"slip_{order['OrderID']}.pdf"
+        )
+        self.print_manager = Mock()
+        self.print_manager.print_batch.return_value = True
+        self.print_manager.print_documents.return_value = True
+
+    def run(self):
+        """Run one processing cycle with the mocked managers"""
+        process_orders(
+            self.config,
+            self.order_manager,
+            self.label_manager,
+            self.packing_generator,
+            self.print_manager,
+        )
+
+    def processed(self):
+        """Order IDs marked as processed, in order"""
+        return [
+            c.args[0] for c in self.order_manager.mark_order_processed.call_args_list
+        ]
+
+    def test_batch_print_success(self):
+        """Test that a whole poll is printed as one job and every order marked"""
+        self.run()
+
+        self.print_manager.print_batch.assert_called_once_with(
+            [
+                Path("label_A.pdf"),
+                Path("slip_A.pdf"),
+                Path("label_B.pdf"),
+                Path("slip_B.pdf"),
+            ]
+        )
+        self.print_manager.print_documents.assert_not_called()
+        assert self.processed() == ["A", "B"]
+
+    def test_batch_print_failure_prints_per_order(self):
+        """Test that a failed batch falls back to one print per order"""
+        self.print_manager.print_batch.return_value = False
+        self.print_manager.print_documents.side_effect = [False, True]
+
+        self.run()
+
+        assert [
+            c.args[0] for c in self.print_manager.print_documents.call_args_list
+        ] == [
+            [Path("label_A.pdf"), Path("slip_A.pdf")],
+            [Path("label_B.pdf"), Path("slip_B.pdf")],
+        ]
+        # Only the order that printed is marked as processed
+        assert self.processed() == ["B"]
+
+    def test_label_failure_skips_order(self):
+        """Test that an order without a label is neither rendered nor printed"""
+        self.label_manager.buy_shipping_label.side_effect = lambda order: (
+            None if order["OrderID"] == "A" else {"pdf_path": Path("label_B.pdf")}
+        )
+
+        self.run()
+
+        self.packing_generator.generate_packing_slips.assert_called_once_with(
+            [{"OrderID": "B"}]
+        )
+        self.print_manager.print_batch.assert_not_called()
+        self.print_manager.print_documents.assert_called_once_with(
+            [Path("label_B.pdf"), Path("slip_B.pdf")]
+        )
+        assert self.processed() == ["B"]
+
+    def test_slip_failure_skips_order(self):
+        """Test that an order whose slip failed is not printed or marked"""
+        self.packing_generator.generate_packing_slips.side_effect = None
+        self.packing_generator.generate_packing_slips.return_value = [
+            Path("slip_A.pdf"),
+            None,
+        ]
+
+        self.run()
+
+        self.print_manager.print_documents.assert_called_once_with(
+            [Path("label_A.pdf"), Path("slip_A.pdf")]
+        )
+        assert self.processed() == ["A"]
+
+    def test_label_workers_limited_by_config(self):
+        """Test that label purchases use at most MAX_CONCURRENCY threads"""
+        self.config.MAX_CONCURRENCY = 1
+        with patch("run.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            self.run()
+
+        mock_pool.assert_called_once_with(max_workers=1)
+        assert self.processed() == ["A", "B"]
+
+    def test_slip_pool_failure_falls_back_to_single_slips(self):
+        """Test that a broken process pool still gets every order printed"""
+        self.packing_generator.generate_packing_slips.side_effect = BrokenProcessPool(
+            "worker died"
+        )
+
+        self.run()
+
+        assert self.packing_generator.generate_packing_slip.call_count == 2
+        self.print_manager.print_batch.assert_called_once_with(
+            [
+                Path("label_A.pdf"),
+                Path("slip_A.pdf"),
+                Path("label_B.pdf"),
+                Path("slip_B.pdf"),
+            ]
+        )
+        assert self.processed() == ["A", "B"]
@@ -4,8 +4,9 @@ Test eBay sandbox integration
 This module contains tests for eBay API integration using sandbox environment.
 Run with: pytest tests/test_sandbox.py -v
 """
-# pylint: disable=redefined-outer-name, too-few-public-methods
+# pylint: disable=redefined-outer-name, too-few-public-methods, protected-access
 import os
+from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
 
@@ -69,6 +70,16 @@ class TestEbayClientInitialization:
         assert hasattr(label_manager, "finding_api")
         assert hasattr(label_manager, "shopping_api")
 
+    def test_api_config_is_built_once(self, config):
+        """Test that the SDK configuration is shared and read-only"""
+        order_manager = OrderManager(config)
+        api_config = order_manager._get_api_config()
+
+        assert api_config is order_manager._get_api_config()
+        assert api_config["domain"] == "api.sandbox.ebay.com"
+        with pytest.raises(TypeError):
+            api_config["domain"] = "api.ebay.com"  # type: ignore[index]
+
 
 class TestSandboxOrderPolling:
     """Test order polling in sandbox environment"""
@@ -135,6 +146,8 @@ class TestSandboxLabelCreation:
         if pdf_path:
             assert pdf_path.exists()
             assert pdf_path.name == f"test_shipping_label_{test_order_id}.pdf"
+            assert pdf_path.read_bytes().startswith(b"%PDF")
+            assert not pdf_path.with_name(pdf_path.name + ".tmp").exists()
 
             # Clean up
             pdf_path.unlink()
@@ -164,6 +177,7 @@ class TestSandboxLabelCreation:
             assert result["status"] == "label_created"
             assert "tracking_number" in result
             assert result["tracking_number"].startswith("TEST")
+            assert isinstance(result["pdf_path"], Path)
 
 
 class TestSandboxIntegration: